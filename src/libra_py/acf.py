@@ -25,6 +25,7 @@ import os
 import sys
 import math
 import copy
+import numpy as np
 
 if sys.platform=="cygwin":
     from cyglibra_core import *
@@ -32,20 +33,130 @@ elif sys.platform=="linux" or sys.platform=="linux2":
     from liblibra_core import *
 
 from . import units
+from . import data_conv
 from . import data_stat
 
+try:
+    # numba is optional - when present, it compiles the direct O(N^2) ACF kernel
+    from numba import njit, prange
+except ImportError:
+    njit, prange = None, range
+
+
+# Tile sizes for the blocked ACF kernel: each (TILE_H x TILE_J) tile keeps its working
+# set of rows in L2, so every loaded sample A[j] is reused across TILE_H lags before
+# it is evicted, instead of re-streaming the whole array once per lag
+_ACF_TILE_H = 64
+_ACF_TILE_J = 4096
+
+def _acf_kernel_py(Af, opt):
+    """Direct O(N^2) summation of the ACF lag sums, tiled over (lag, sample) blocks
+
+    Args:
+        Af ( np.ndarray(ndof, N) ): transposed stacked time-series, one row per DOF,
+            so that the samples of each DOF are contiguous along the long time axis
+        opt ( int ): normalization convention, same as in :func:`acf_mat`
+
+    Returns:
+        np.ndarray(N): the normalized ACF for all lags
+
+    """
+
+    ndof, N = Af.shape
+    out = np.zeros(N)
+
+    nbh = (N + _ACF_TILE_H - 1)//_ACF_TILE_H
+    for bh in prange(nbh):             # each lag belongs to exactly one tile, so the
+        h0 = bh*_ACF_TILE_H            # parallel accumulation into out[h] is race-free
+        h1 = min(h0 + _ACF_TILE_H, N)
+
+        for j0 in range(0, N, _ACF_TILE_J):
+            j1 = min(j0 + _ACF_TILE_J, N)
+
+            for h in range(h0, h1):
+                jmax = min(j1, N - h)
+                s = 0.0
+                for k in range(ndof):
+                    for j in range(j0, jmax):   # both reads are stride-1 along the time axis
+                        s += Af[k, j]*Af[k, j+h]
+                out[h] += s
+
+    for h in range(N):
+        if opt==0:
+            out[h] /= ((N-h)*ndof)
+        else:
+            out[h] /= (N*ndof)
+
+    return out
+
+_acf_kernel = _acf_kernel_py
+if njit is not None:
+    # the explicit signature pins the kernel to float64 input, so there is no lazy
+    # first-call compilation and no dispatcher overhead, and cache=True persists the
+    # compiled object under __pycache__ across Python sessions
+    _acf_kernel = njit('f8[:](f8[:,:], i8)', parallel=True, fastmath=True, cache=True)(_acf_kernel_py)
 
-def acf_mat(data, dt, opt=0):
-    """Compute the autocorrelation function of the given data set
+
+def _stack(data):
+    """Stack a time-series of column-matrices into a single numpy array
 
     Args:
         data ( list of MATRIX(ndof, 1) objects ): sequence of real-valued ndof-dimensional vectors
+
+    Returns:
+        np.ndarray(N, ndof): the same data, one row per data point
+
+    """
+
+    return np.array([ data_conv.matrix2list(d) for d in data ])
+
+
+def center_data(data):
+    """Center data on zero in a single pass over the stacked array
+
+    Stacks the data once and subtracts the column-wise average, so the series is
+    converted into fluctuations dX(t) = X(t) - <X> without the extra sweep of
+    MATRIX additions that a separate averaging step would take
+
+    Args:
+        data ( list of MATRIX(ndof, 1) objects ): sequence of real-valued ndof-dimensional vectors
+
+    Returns:
+        np.ndarray(N, ndof): the centered data, one row per data point
+
+    SeeAlso:
+        data_stat.mat_center_data - same operation, but returning a list of MATRIX objects
+
+    """
+
+    A = _stack(data)
+    A -= A.mean(axis=0, keepdims=True)
+    return A
+
+
+def acf_mat(data, dt, opt=0, method=0, dtype=np.float64):
+    """Compute the autocorrelation function of the given data set
+
+    Args:
+        data ( list of MATRIX(ndof, 1) objects or np.ndarray(N, ndof) ): sequence of
+            real-valued ndof-dimensional vectors, either as column-matrices or already
+            stacked into an array (e.g. by :func:`center_data`)
         dt ( double ): time distance between the adjacent data points [units: general]
         opt ( int ): selector of the convention to to compute ACF
 
             * 0 : the chemist convention,  (1/(N-h)) Sum_{t=1,N-h} (Y[t]*Y[t+h])
             * 1 : the statistician convention, (1/N) Sum_{t=1,N-h} (Y[t]*Y[t+h])
 
+        method ( int ): selector of the summation algorithm
+
+            * 0 : FFT-based, via the Wiener-Khinchin theorem [ default ]
+            * 1 : direct O(N^2) summation; compiled with numba if it is available
+
+        dtype ( np.dtype ): floating-point type for the computation [ default: np.float64 ]
+            Use np.float32 for long trajectories where the ACF is only FFT-ed/plotted
+            afterwards - it halves the memory traffic and doubles the SIMD width at
+            the cost of single precision
+
     Returns:
         tuple: (T, nautocorr, autocorr), where:
 
@@ -53,28 +164,49 @@ def acf_mat(data, dt, opt=0):
             nautocorr (list of sz doubles ): normalized ACF
             autocorr (list of sz doubles ): un-normalized ACF
 
+    Note:
+        The lag sums Sum_{t} (Y[t]*Y[t+h]) are computed at once for all lags h via
+        the Wiener-Khinchin theorem (inverse FFT of the power spectrum), so the cost
+        is O(N log N) rather than O(N^2) as in the direct summation
+
     SeeAlso:
         https://www.itl.nist.gov/div898/handbook/eda/section3/autocopl.htm
 
 
     """
 
-    sz = len(data)    # For now, we will use the full data set 
+    sz = len(data)    # For now, we will use the full data set
 
                       ###               how many elements we have in the time series
-                      ###  old comments we use only a half of the point, because of the 
+                      ###  old comments we use only a half of the point, because of the
                       ###               poorer statistics we get otherwise
-    autocorr = []
-    ndof = data[0].num_of_rows
+    # Stack the time-series into a (sz, ndof) array - one row per data point
+    if isinstance(data, np.ndarray):
+        A = data
+    else:
+        A = _stack(data)
+    A = A.astype(dtype, copy=False)   # no copy when the data is already of this type
+    ndof = A.shape[1]
+
+    if method==1:
+        # transpose once, so the kernel sweeps each DOF contiguously along time;
+        # the direct kernel is compiled for float64, so it always gets that type
+        autocorr = _acf_kernel(np.ascontiguousarray(A.T, dtype=np.float64), opt).tolist()
+
+    else:
+        # Wiener-Khinchin: the raw lag sums Sum_{j} A[j]*A[j+h] are the inverse FFT of
+        # the power spectrum |FFT(A)|^2. Zero-pad to at least 2*sz to avoid the circular
+        # wrap-around, rounding up to a power of 2 for the FFT speed
+        n2 = 1 << (2*sz - 1).bit_length()
+        F = np.fft.rfft(A, n=n2, axis=0)
+        raw = np.fft.irfft(F * np.conj(F), n=n2, axis=0)[:sz].sum(axis=1)
 
-    for i in range(0,sz):
-        total = 0.0
-        for j in range(0,sz-i):
-            total += (data[j].T()*data[j+i]).get(0)   # scalar product
         if opt==0:
-            autocorr.append( total/((sz-i)*ndof) )  # less bias, chemistry adopted
+            denom = np.arange(sz, 0, -1) * float(ndof)   # (sz-i)*ndof: less bias, chemistry adopted
         elif opt==1:
-            autocorr.append( total/(sz*ndof) )      # statistically-preferred option
+            denom = np.full(sz, sz*float(ndof))          # sz*ndof: statistically-preferred option
+
+        autocorr = (raw/denom).tolist()
 
     #normalize the ACF	
     nautocorr = []
@@ -38,6 +38,7 @@ import sys
 import math
 import copy
 import time
+import functools
 
 if sys.platform=="cygwin":
     from cyglibra_core import *
@@ -49,6 +50,53 @@ import util.libutil as comn
 import libra_py.units as units
 from . import save
 
+_IDX_CACHE = {}
+
+def _rng(a, b):
+    """Return a Py2Cpp_int index vector for the range [a, b), cached at module scope
+
+    The index vectors are only read on the C++ side, so one object per (a, b) pair
+    can be reused across repeated run_dynamics calls (e.g. in parameter sweeps)
+    instead of materializing a new Python list and converting it every time
+
+    """
+    key = (a, b)
+    v = _IDX_CACHE.get(key)
+    if v is None:
+        v = Py2Cpp_int(list(range(a, b)))
+        _IDX_CACHE[key] = v
+    return v
+
+
+@functools.lru_cache(maxsize=32)
+def _build_heom_topology(n, LL, verbosity):
+    """Generate (and memoize) the HEOM hierarchy topology
+
+    Args:
+        n ( int ): the number of the bath operators, nquant*(KK+1)
+        LL ( int ): the hierarchy level
+        verbosity ( int ): the verbosity of the printout during the generation
+
+    Returns:
+        tuple: (all_vectors, vec_plus, vec_minus) - the hierarchy index vectors and
+            the maps to the higher/lower tiers, as produced by gen_hierarchy
+
+    The topology depends only on (n, LL), so for repeated run_dynamics calls with
+    the same dimensions (e.g. parameter sweeps over many trajectories) the whole
+    hierarchy generation is done only once and the cached lists are reused - they
+    are never modified downstream
+
+    """
+
+    all_vectors = intList2()
+    vec_plus = intList2()
+    vec_minus = intList2()
+
+    gen_hierarchy(n, LL, verbosity, all_vectors, vec_plus, vec_minus)
+
+    return all_vectors, vec_plus, vec_minus
+
+
 def aux_print_matrices(step, x):
     print(F"= step = {step} =")
     nmat = len(x)
@@ -95,7 +143,10 @@ def update_filters(rho_scaled, params, aux_memory):
     # Filtering of the densities - defines the list of nonzero derivatives, params["nonzero"]
     params["nonzero"] = filter(aux_memory["rho_unpacked_scaled"], trash, params["adm_tolerance"], params["do_zeroing"])
 
-    pack_mtx(aux_memory["rho_unpacked_scaled"], rho_scaled)
+    # the filtering modifies the ADMs only when zeroing is requested - otherwise
+    # there is nothing to copy back into the packed form
+    if params["do_zeroing"]==1:
+        pack_mtx(aux_memory["rho_unpacked_scaled"], rho_scaled)
 
 
 
@@ -355,11 +406,7 @@ def run_dynamics(dyn_params, Ham, rho_init):
     KK = dyn_params["KK"]
     LL = dyn_params["LL"]
 
-    all_vectors = intList2()
-    vec_plus = intList2()
-    vec_minus = intList2()
-
-    gen_hierarchy(nquant * (KK+1), LL, params["verbosity"], all_vectors, vec_plus, vec_minus)
+    all_vectors, vec_plus, vec_minus = _build_heom_topology(nquant * (KK+1), LL, params["verbosity"])
     params.update( { "nvec":all_vectors, "nvec_plus":vec_plus, "nvec_minus":vec_minus } )
 
     nn_tot = len(all_vectors)
@@ -400,10 +447,11 @@ def run_dynamics(dyn_params, Ham, rho_init):
         aux_memory["drho_unpacked"].append( CMATRIX(nquant, nquant))
         aux_memory["drho_unpacked_scaled"].append( CMATRIX(nquant, nquant))
 
-    # Initial conditions
-    x_ = Py2Cpp_int(list(range(nquant)))
-    y_ = Py2Cpp_int(list(range(nquant)))
-    push_submatrix(rho, rho_init, x_, y_)
+    # Initial conditions: rho_init goes into the top slab of the stacked rho.
+    # The row and column index patterns are identical, so one cached C++ index
+    # vector serves for both
+    idx_ = _rng(0, nquant)
+    push_submatrix(rho, rho_init, idx_, idx_)
 
     #unpack_mtx(aux_memory["rho_unpacked"], rho)
 
@@ -423,13 +471,25 @@ def run_dynamics(dyn_params, Ham, rho_init):
 
     #========== Filter scaled ADMs ======================
     params.update({ "nonzero": Py2Cpp_int(init_nonzero), "adm_list": Py2Cpp_int( all_indices ) } )
-    update_filters(rho_scaled, params, aux_memory)
+
+    # The C++ derivative and filtering routines rescan every entry of the dict they
+    # receive on each call, and the derivatives are requested 4 times per RK4 step.
+    # So keep a slim dict with only the keys those routines actually read
+    deriv_params = { key : params[key] for key in
+                     ["KK", "Ham", "eta", "gamma", "temperature",
+                      "gamma_matsubara", "c_matsubara",
+                      "truncation_scheme", "do_scale", "el_phon_couplings",
+                      "nvec", "nvec_plus", "nvec_minus", "num_threads",
+                      "adm_tolerance", "adm_deriv_tolerance", "do_zeroing",
+                      "nonzero", "adm_list"] }
+
+    update_filters(rho_scaled, deriv_params, aux_memory)
 
 
 
     if params["verbosity"]>=2:
-        print("nonzero = ", Cpp2Py(params["nonzero"]))
-        print("adm_list = ", Cpp2Py(params["adm_list"]))
+        print("nonzero = ", Cpp2Py(deriv_params["nonzero"]))
+        print("adm_list = ", Cpp2Py(deriv_params["adm_list"]))
 
         if params["verbosity"]>=4:
             print("ADMs")
@@ -444,23 +504,32 @@ def run_dynamics(dyn_params, Ham, rho_init):
     #============== Propagation =============
 
 
+    dt = params["dt"]
+    filter_after_steps = params["filter_after_steps"]
+
+    have_savers = ( _savers["hdf5_saver"] != None or _savers["txt_saver"] != None
+                    or _savers["mem_saver"] != None )
+
     start = time.time()
     for step in range(params["nsteps"]):
 
         #================ Saving and printout ===================
-        # scaled -> raw
-        transform_adm(rho, rho_scaled, aux_memory, params, -1)
+        # scaled -> raw: this unpack/pack sweep over all the ADMs is needed only
+        # when somebody consumes the raw matrices this step
+        if have_savers or (params["verbosity"]>=4 and step%print_freq==0):
+            transform_adm(rho, rho_scaled, aux_memory, params, -1)
 
         # Save the variables
-        save.save_heom_data(_savers, step, print_freq, params, aux_memory["rho_unpacked"])
+        if have_savers:
+            save.save_heom_data(_savers, step, print_freq, params, aux_memory["rho_unpacked"])
 
 
         if step%print_freq==0:
             print(F" step= {step}")
 
             if params["verbosity"]>=3:
-                print("nonzero = ", Cpp2Py(params["nonzero"]))
-                print("adm_list = ", Cpp2Py(params["adm_list"]))
+                print("nonzero = ", Cpp2Py(deriv_params["nonzero"]))
+                print("adm_list = ", Cpp2Py(deriv_params["adm_list"]))
 
             if params["verbosity"]>=4:
                 print("ADMs")
@@ -472,17 +541,17 @@ def run_dynamics(dyn_params, Ham, rho_init):
 
 
         #============== Update the list of active equations = Filtering  ============
-        if step % params["filter_after_steps"] == 0:
+        if step % filter_after_steps == 0:
 
             # To assess which equations to discard, lets estimate the time-derivatives of rho
             # for all the matrices
-            params["adm_list"] = Py2Cpp_int( all_indices )
+            deriv_params["adm_list"] = Py2Cpp_int( all_indices )
 
-            update_filters(rho_scaled, params, aux_memory)
+            update_filters(rho_scaled, deriv_params, aux_memory)
 
 
         #================= Propagation for one timestep ==================================
-        rho_scaled = RK4(rho_scaled, params["dt"], compute_heom_derivatives, params)
+        rho_scaled = RK4(rho_scaled, dt, compute_heom_derivatives, deriv_params)
 
 
     end = time.time()
@@ -114,12 +114,17 @@ def init_heom_savers(params, nquant):
 
 
 
-def save_heom_hdf5(step, saver, params, denmat):
-    
-    dt = params["dt"]    
-    hdf5_output_level = params["hdf5_output_level"]
+def save_heom_hdf5(step, saver, params, denmat, output_level=None):
+
+    dt = params["dt"]
+
+    # by default, controlled by the hdf5 output level; the caller may override it
+    # (e.g. the mem saver re-uses this function with its own level)
+    hdf5_output_level = output_level
+    if hdf5_output_level is None:
+        hdf5_output_level = params["hdf5_output_level"]
+
 
-    
     if hdf5_output_level>=1:
         # Timestep 
         saver.save_scalar(step, "timestep", step) 
@@ -147,9 +152,7 @@ def save_heom_data(_savers, step, print_freq, params, rho_unpacked):
     if _savers["txt_saver"] != None:            
         pass
         
-    if _savers["mem_saver"] != None:            
-        prms = dict(params)
-        prms["hdf5_output_level"] = prms["mem_output_level"]
-        save_heom_hdf5(step, _savers["mem_saver"], prms, rho_unpacked[0])
+    if _savers["mem_saver"] != None:
+        save_heom_hdf5(step, _savers["mem_saver"], params, rho_unpacked[0], params["mem_output_level"])
 
     
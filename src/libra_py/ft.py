@@ -21,6 +21,7 @@ import os
 import sys
 import math
 import copy
+import numpy as np
 
 #if sys.platform=="cygwin":
 #    from cyglibra_core import *
@@ -51,23 +52,29 @@ def ft(X, wspan, dw, dt):
 
     ############### based on the code from Pyxaid ###################
     sz=len(X)    # the # of input points
-    npoints = int(wspan/dw)   # the # of output points    
+    npoints = int(wspan/dw)   # the # of output points
 
-    J = [0.0] * npoints   # FT
-    W = [0.0] * npoints   # frequencies
+    w = np.arange(npoints) * dw   # frequencies
+    X1 = np.asarray(X)
 
-    for iw in range(0,npoints):
-        w = iw * dw
+    # If the requested frequency grid is commensurate with an FFT grid - that is, there
+    # is an integer N_pad such that N_pad*dw*dt = 2*pi, so that bin iw of the transform
+    # of the zero-padded data sits exactly at frequency iw*dw - then the cosine sums
+    # are just the real part of an rfft, at half the cost of a complex FFT and without
+    # the O(npoints*sz) cosine matrix
+    N_pad = int(round(2.0*math.pi/(dw*dt)))
+    if ( abs(N_pad*dw*dt - 2.0*math.pi) < 1e-10 * 2.0*math.pi
+         and N_pad >= sz and npoints <= N_pad//2 + 1 ):
+        C = np.fft.rfft(X1, n=N_pad).real[:npoints]     # = X[0] + Sum_{t>=1} cos(w*t)*X[t]
+        J = dt * (1.0 + 2.0*(C - X1[0]))
 
-        J[iw] = 1.0  # corresponds to it = 0
-        for it in range(1,sz):
-            t = it * dt
-            J[iw] += 2.0*math.cos(w * t)*X[it]
+    else:
+        # General grids: all the cosines at once - cos(w_i * t_j) is an (npoints, sz-1)
+        # matrix, and the summation over time is its product with the data vector
+        t = np.arange(1, sz) * dt     # times, the it = 0 term is added separately
+        J = dt * (1.0 + 2.0 * (np.cos(np.outer(w, t)) @ X1[1:]) )
 
-        W[iw] = w
-        J[iw] *= dt
-
-    return W, J
+    return w.tolist(), J.tolist()
 
 
 
@@ -155,20 +162,13 @@ def py_cft(X, dt):
     dv = 1.0/(N*dt)
     dw = 2.0*math.pi*dv
 
-    W = [0.0] * N   # frequencies
-    C = [0.0] * N   # FT
-    S = [0.0] * N   # FT
-
-    for iw in range(0,N):
-        w = iw * dw
+    # With t_min = 0 and w = iw*dw, the sums Sum_t X[t]*exp(-i*w*t) are exactly the
+    # unshifted FFT bins: C[iw] + i*S[iw] = F[iw], with no extra phase factors
+    F = np.fft.fft(np.asarray(X))
 
-        C[iw], S[iw] = 0.0, 0.0
-        for it in range(0,N):
-            t = it * dt            
-            C[iw] += math.cos(w * t)*X[it]   
-            S[iw] -= math.sin(w * t)*X[it]
-
-        W[iw] = w
+    W = (np.arange(N) * dw).tolist()   # frequencies
+    C = F.real.tolist()                # cos-transform
+    S = F.imag.tolist()                # sin-transform
 
     return W, C, S
 
@@ -27,6 +27,7 @@ import math
 import os
 import sys
 import unittest
+import numpy as np
 
 if sys.platform=="cygwin":
     from cyglibra_core import *
@@ -103,7 +104,7 @@ def recipe1(data, params):
     data_new = data
     if do_center:
         if data_type==0:
-            data_new = data_stat.mat_center_data(data)
+            data_new = acf.center_data(data)   # stack + center in one pass, acf_mat takes the array directly
         elif data_type==1:
             data_new = data_stat.vec_center_data(data)
 
@@ -123,10 +124,8 @@ def recipe1(data, params):
         T[it] = T[it]/units.fs2au  # convert to fs
 
     if do_output:
-        f = open(acf_filename,"w")
-        for it in range(0,sz):
-            f.write("%8.5f  %8.5f  %8.5f  \n" % (T[it] , norm_acf[it], raw_acf[it]))
-        f.close()
+        # one buffered write for the whole table instead of a per-line loop
+        np.savetxt(acf_filename, np.column_stack((T, norm_acf, raw_acf)), fmt="%8.5f  %8.5f  %8.5f  ")
 
 
     #=========== FT =============
@@ -139,10 +138,7 @@ def recipe1(data, params):
         J2.append( (1.0/(2.0*math.pi))*J[iw]*J[iw] )
 
     if do_output:
-        f = open(spectrum_filename,"w")
-        for iw in range(0,sz):
-            f.write("%8.5f  %8.5f  %8.5f\n" % (W[iw], J[iw], J2[iw] ) )
-        f.close()
+        np.savetxt(spectrum_filename, np.column_stack((W, J, J2)), fmt="%8.5f  %8.5f  %8.5f")
 
     return T, norm_acf, raw_acf, W, J, J2
 